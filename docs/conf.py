@@ -3,6 +3,7 @@
 For the full list of built-in configuration values, see the documentation:
 https://www.sphinx-doc.org/en/master/usage/configuration.html
 """
+import os
 import sys
 from pathlib import Path
 
@@ -47,7 +48,11 @@ intersphinx_mapping = {
 bibtex_bibfiles = ["references.bib"]
 
 # Run process_tutorials.py to convert notebooks to create a zip file with exercises.
-process_tutorials()
+# The exercises are only recreated if a tutorial notebook or helper file has changed
+# since the last build. Set SPHINX_SKIP_NOTEBOOK_CONVERT=1 to skip processing the
+# tutorials, including the execution of the notebooks.
+if os.environ.get("SPHINX_SKIP_NOTEBOOK_CONVERT") != "1":
+    process_tutorials()
 
 # -- Options for HTML output -------------------------------------------------
 # https://www.sphinx-doc.org/en/master/usage/configuration.html#options-for-html-output
@@ -22,6 +22,7 @@ CURRENT_DIR = Path(__file__).resolve().parent
 MAIN_DIR = CURRENT_DIR.parent
 TUTORIALS_DIR = CURRENT_DIR / "tutorials"
 EXERCISES_DIR = TUTORIALS_DIR / "exercises"
+ZIP_FILE = TUTORIALS_DIR / "tutorials.zip"
 
 
 class ClearSolutionsPreProcessor(Preprocessor):
@@ -121,6 +122,43 @@ def convert_notebook(
 
 def main() -> None:
     """Convert notebooks and create a zip file with exercises."""
+    if not exercises_are_up_to_date():
+        create_exercises()
+
+    # Execute notebooks.
+    notebooks = notebooks_to_execute()
+    if notebooks:
+        command = get_command_environment()
+        install_local_brim_version(command)
+        for notebook in notebooks:
+            execute_notebook(notebook, command)
+        # Executing the notebooks in place does not change the exercises, so the zip
+        # file is stamped to remain newer than the executed notebooks.
+        if ZIP_FILE.is_file():
+            os.utime(ZIP_FILE)
+
+
+def get_tutorial_source_files() -> tuple[Path, ...]:
+    """Return the notebooks and helper files from which the exercises are created."""
+    return tuple(
+        path for path in TUTORIALS_DIR.iterdir()
+        if path.suffix in (".ipynb", ".py") or path.name in (
+            "README.md", "tutorials_environment.yml")
+    )
+
+
+def exercises_are_up_to_date() -> bool:
+    """Check if the zip file with exercises is newer than all tutorial source files."""
+    if not ZIP_FILE.is_file() or not EXERCISES_DIR.is_dir():
+        return False
+    zip_mtime = ZIP_FILE.stat().st_mtime
+    return all(
+        path.stat().st_mtime <= zip_mtime for path in get_tutorial_source_files()
+    )
+
+
+def create_exercises() -> None:
+    """Convert notebooks to exercises and create a zip file with them."""
     required_files = {}
 
     # Create a folder with exercise notebooks.
@@ -128,7 +166,7 @@ def main() -> None:
         EXERCISES_DIR.mkdir()
     notebooks = [f for f in os.listdir(TUTORIALS_DIR) if f.endswith(".ipynb")]
     for notebook in notebooks:
-        body, resources = convert_notebook(
+        _, resources = convert_notebook(
             TUTORIALS_DIR / notebook, EXERCISES_DIR / notebook
         )
         required_files.update(resources["required_files"])
@@ -136,14 +174,6 @@ def main() -> None:
     # Create a zip file with exercise notebooks.
     create_zip(required_files)
 
-    # Execute notebooks.
-    notebooks = notebooks_to_execute()
-    if notebooks:
-        command = get_command_environment()
-        install_local_brim_version(command)
-        for notebook in notebooks:
-            execute_notebook(notebook, command)
-
 
 def create_zip(required_files: dict[str, str]) -> None:
     """Create a zip file with exercise notebooks."""
@@ -161,7 +191,7 @@ def create_zip(required_files: dict[str, str]) -> None:
         shutil.copy(TUTORIALS_DIR / file, zip_dir)
 
     # Create a zip file.
-    with zipfile.ZipFile(TUTORIALS_DIR / "tutorials.zip", "w") as f:
+    with zipfile.ZipFile(ZIP_FILE, "w") as f:
         for path in zip_dir.rglob("*"):
             if path.is_file():
                 f.write(path, path.relative_to(zip_dir))
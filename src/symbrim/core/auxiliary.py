@@ -1,7 +1,9 @@
 """Utility to compute the noncontributing forces and torques."""
 from __future__ import annotations
 
+from collections import defaultdict, deque
 from dataclasses import dataclass
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from sympy import Function
@@ -65,7 +67,7 @@ class AuxiliaryData:
         load_point.set_vel(inertial_frame, self.auxiliary_velocity)
         return Force(load_point, self.load_symbol * self.direction)
 
-    @property
+    @cached_property
     def auxiliary_velocity(self) -> Vector:
         """Auxiliary velocity as vector."""
         return self.speed_symbol * self.direction
@@ -113,6 +115,7 @@ class AuxiliaryDataHandler:
         self._inertial_frame = inertial_frame
         self._inertial_point = inertial_point
         self._position_tree = None  # Chosen structure is {parent: [child1, ...]}
+        self._parent_map = None  # Reverse lookup of the tree {child: parent}
         self._aux_vels_points = None
         self.auxiliary_data_list: list[AuxiliaryData] = []
 
@@ -164,41 +167,25 @@ class AuxiliaryDataHandler:
             def get_childs(parent: object) -> Iterable[object]:
                 return getattr(parent, attr_name)
         tree = {}
-        queue = [root]
+        queue = deque([root])
         while queue:
-            parent = queue.pop(0)
+            parent = queue.popleft()
             if parent in tree:
                 raise ValueError("Graph contains a cycle.")
-            tree[parent] = []
-            for neighbor in get_childs(parent):
-                if neighbor not in tree:
-                    queue.append(neighbor)
-                    tree[parent].append(neighbor)
+            tree[parent] = [nb for nb in get_childs(parent) if nb not in tree]
+            queue.extend(tree[parent])
         return tree
 
-    @staticmethod
-    def _get_children_from_tree(
-        tree: dict[object, list[object]], parent: object, include_parent: bool = False
-    ) -> list[object]:
-        """Get children of a node in a tree."""
-        queue = tree[parent].copy()
-        children = [parent] if include_parent else []
-        while queue:
-            child = queue.pop(0)
-            children.append(child)
-            queue.extend(tree[child])
-        return children
-
     def retrieve_graphs(self) -> None:
         """Read in the graphs of the system."""
         self._position_tree = self._extract_tree(self.inertial_point, "_pos_dict")
+        self._parent_map = {child: parent
+                            for parent, childs in self._position_tree.items()
+                            for child in childs}
 
     def _get_parent(self, point: Point) -> Point | None:
         """Get parent point in the position tree."""
-        for parent, childs in self._position_tree.items():
-            if point in childs:
-                return parent
-        return None
+        return self._parent_map.get(point)
 
     def _compute_velocity(self, point: Point, parent: Point | None = None) -> Vector:
         """Compute the velocity of a point based on its parent in the position tree."""
@@ -216,22 +203,30 @@ class AuxiliaryDataHandler:
         if self.inertial_frame not in parent._vel_dict:
             self._compute_velocity(parent)
         shared_frames = set(point._vel_dict).intersection(parent._vel_dict)
-        # Compute velocity based on the velocity two point theorem if possible.
+        # Search a frame in which both points are fixed, such that the velocity two
+        # point theorem can be used. Otherwise, search a frame in which the parent is
+        # fixed, such that the velocity one point theorem can be used.
+        v2pt_frame = v1pt_frame = None
         for frame in shared_frames:
-            if point._vel_dict[frame] == 0 and parent._vel_dict[frame] == 0:
-                point.set_vel(self.inertial_frame,
-                              self._compute_velocity(parent)
-                              - cross(point.pos_from(parent),
-                                      frame.ang_vel_in(self.inertial_frame)))
-                return point._vel_dict[self.inertial_frame]
-        # Compute velocity based on the velocity one point theorem if possible.
-        for frame in shared_frames:
-            if parent._vel_dict[frame] == 0 and frame in point._vel_dict:
-                point.set_vel(self.inertial_frame,
-                              self._compute_velocity(parent) + point._vel_dict[frame]
-                              - cross(point.pos_from(parent),
-                                      frame.ang_vel_in(self.inertial_frame)))
-                return point._vel_dict[self.inertial_frame]
+            if parent._vel_dict[frame] != 0:
+                continue
+            if point._vel_dict[frame] == 0:
+                v2pt_frame = frame
+                break
+            if v1pt_frame is None:
+                v1pt_frame = frame
+        if v2pt_frame is not None:
+            point.set_vel(self.inertial_frame,
+                          self._compute_velocity(parent)
+                          - cross(point.pos_from(parent),
+                                  v2pt_frame.ang_vel_in(self.inertial_frame)))
+            return point._vel_dict[self.inertial_frame]
+        if v1pt_frame is not None:
+            point.set_vel(self.inertial_frame,
+                          self._compute_velocity(parent) + point._vel_dict[v1pt_frame]
+                          - cross(point.pos_from(parent),
+                                  v1pt_frame.ang_vel_in(self.inertial_frame)))
+            return point._vel_dict[self.inertial_frame]
         # Fall back to velocity computation based on vector differentiation.
         point.set_vel(self.inertial_frame,
                       parent._vel_dict[self.inertial_frame] +
@@ -243,37 +238,38 @@ class AuxiliaryDataHandler:
         if self._aux_vels_points is not None:
             raise ValueError("Auxiliary speeds have already been applied.")
         self.retrieve_graphs()
-        all_points = self._get_children_from_tree(
-            self._position_tree, self.inertial_point, include_parent=True)
-        self._aux_vels_points = {pt: Vector(0) for pt in all_points}
 
         if self.auxiliary_torques_data:  # pragma: no cover
             raise NotImplementedError(
                 "Support for noncontributing torques has not been implemented")
 
-        # Add auxiliary velocities to auxiliary speed graph of the points
+        # Sum the auxiliary velocities of the forces applied at each point.
+        local_aux_vels = defaultdict(lambda: Vector(0))
         for load in self.auxiliary_forces_data:
             if load.location not in self._position_tree:
                 raise ValueError(
                     f"The point of the noncontributing force {load!r} is not connected"
                     f" to {self.inertial_point!r}.")
-            for point in self._get_children_from_tree(
-                self._position_tree, load.location, include_parent=True):
-                self._aux_vels_points[point] += load.auxiliary_velocity
+            local_aux_vels[load.location] += load.auxiliary_velocity
 
-        # Set all speeds using a breath first search.
+        # Set all speeds using a breath first search, while propagating the auxiliary
+        # velocities from each point to its children.
         # This is done before adding the auxiliary forces because auxiliary speeds may
         # otherwise also be added by Point.vel.
-        queue = [self.inertial_point]
+        self._aux_vels_points = {
+            self.inertial_point: local_aux_vels.get(self.inertial_point, Vector(0))}
+        queue = deque([self.inertial_point])
         while queue:
-            parent = queue.pop(0)
+            parent = queue.popleft()
             for child in self._position_tree[parent]:
                 self._compute_velocity(child, parent)
+                self._aux_vels_points[child] = self._aux_vels_points[parent]
+                if child in local_aux_vels:
+                    self._aux_vels_points[child] += local_aux_vels[child]
                 queue.append(child)
 
         # Add auxiliary speeds to each point of the graph.
-        for point in all_points:
-            aux_vel = self._aux_vels_points[point]
+        for point, aux_vel in self._aux_vels_points.items():
             if aux_vel != 0:
                 point.set_vel(self.inertial_frame,
                               point._vel_dict[self.inertial_frame] + aux_vel)
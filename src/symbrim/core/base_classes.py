@@ -1,6 +1,7 @@
 """Module containing the base class for all models in SymBRiM."""
 from __future__ import annotations
 
+import re
 from abc import ABCMeta
 from functools import wraps
 from typing import TYPE_CHECKING
@@ -28,17 +29,18 @@ if TYPE_CHECKING:
 __all__ = ["ConnectionBase", "ConnectionMeta", "LoadGroupBase", "LoadGroupMeta",
            "ModelBase", "ModelMeta", "set_default_convention"]
 
+_NUMERIC_RANGE = re.compile(r"(\D*?)(\d+):(\d+)")
+
 
 def _get_requirements(bases, namespace, req_attr_name):  # noqa: ANN001, ANN202
     requirements = {}
     for base_cls in bases:
         base_reqs = getattr(base_cls, req_attr_name, None)
         if base_reqs is not None:
-            for req in base_reqs:
-                requirements[req.attribute_name] = req
+            requirements.update((req.attribute_name, req) for req in base_reqs)
     if req_attr_name in namespace:
-        for req in namespace[req_attr_name]:
-            requirements[req.attribute_name] = req
+        requirements.update(
+            (req.attribute_name, req) for req in namespace[req_attr_name])
     return tuple(requirements.values())
 
 
@@ -53,6 +55,8 @@ def _create_submodel_property(requirement: ModelRequirement) -> property:
                 f"{requirement.type_name}, but {model!r} is an instance of "
                 f"{type(model)}.")
         setattr(self, f"_{requirement.attribute_name}", model)
+        self._submodels = None  # Reset the cached submodels.
+        self._invalidate_descriptions()
 
     getter.__annotations__ = {"return": requirement.type_hint}
     setter.__annotations__ = {"model": requirement.type_hint, "return": None}
@@ -70,6 +74,8 @@ def _create_connection_property(requirement: ConnectionRequirement) -> property:
                 f"of {requirement.type_name}, but {conn!r} is an instance of "
                 f"{type(conn)}.")
         setattr(self, f"_{requirement.attribute_name}", conn)
+        self._connections = None  # Reset the cached connections.
+        self._invalidate_descriptions()
 
     getter.__annotations__ = {"return": requirement.type_hint}
     setter.__annotations__ = {"conn": requirement.type_hint, "return": None}
@@ -85,12 +91,12 @@ class ModelMeta(ABCMeta):
         requirements = _get_requirements(bases, namespace, "required_models")
         for req in requirements:
             namespace[req.attribute_name] = _create_submodel_property(req)
-        namespace["required_models"] = tuple(requirements)  # Update the requirements
+        namespace["required_models"] = requirements  # Update the requirements
         # Create properties for each of the requirements
         requirements = _get_requirements(bases, namespace, "required_connections")
         for req in requirements:
             namespace[req.attribute_name] = _create_connection_property(req)
-        namespace["required_connections"] = tuple(requirements)  # Update
+        namespace["required_connections"] = requirements  # Update
         instance = super().__new__(mcs, name, bases, namespace, **kwargs)
         Registry().register_model(instance)
         return instance
@@ -105,7 +111,7 @@ class ConnectionMeta(ABCMeta):
         requirements = _get_requirements(bases, namespace, "required_models")
         for req in requirements:
             namespace[req.attribute_name] = _create_submodel_property(req)
-        namespace["required_models"] = tuple(requirements)  # Update the requirements
+        namespace["required_models"] = requirements  # Update the requirements
         instance = super().__new__(mcs, name, bases, namespace, **kwargs)
         Registry().register_connection(instance)
         return instance
@@ -132,11 +138,14 @@ class BrimBase:
         name : str
             Name of the object.
         """
-        if not name.isidentifier():
+        if not (isinstance(name, str) and name.isidentifier()):
             raise ValueError("The name of an object should be a valid identifier.")
-        self._name = str(name)
+        self._name = name
         self._system = None
         self._auxiliary_handler = None
+        self._descriptions_version = 0
+        self._all_descriptions: dict[object, str] = {}
+        self._all_descriptions_key: tuple[int, ...] | None = None
         self.symbols: dict[str, object] = {}
         self.q: MutableDenseMatrix = MutableDenseMatrix()
         self.u: MutableDenseMatrix = MutableDenseMatrix()
@@ -150,10 +159,16 @@ class BrimBase:
         Helper function to add the name of the object as a prefix to a set of names.
         This is used to create unique names for the objects in the model.
         """
-        syms = symbols(names)
-        if isinstance(syms, tuple):
-            return ", ".join(f"{self.name}_{sym.name}" for sym in syms)
-        return f"{self.name}_{syms.name}"
+        parsed_names = []
+        for name in names.replace(",", " ").split():
+            if ":" not in name:
+                parsed_names.append(name)
+            elif match := _NUMERIC_RANGE.fullmatch(name):
+                stem, start, stop = match.groups()
+                parsed_names.extend(f"{stem}{i}" for i in range(int(start), int(stop)))
+            else:  # Let SymPy parse more advanced range syntaxes.
+                parsed_names.extend(sym.name for sym in symbols(name, seq=True))
+        return ", ".join(f"{self.name}_{name}" for name in parsed_names)
 
     @property
     def name(self) -> str:
@@ -172,25 +187,38 @@ class BrimBase:
         return {}
 
     def get_description(self, obj: object) -> str | None:
-        """Get description of a given object."""
-        if obj in self.descriptions:
-            return self.descriptions[obj]
-        if hasattr(self, "submodels"):
-            for submodel in self.submodels:
-                desc = submodel.get_description(obj)
-                if desc is not None:
-                    return desc
-        if hasattr(self, "connections"):
-            for conn in self.connections:
-                desc = conn.get_description(obj)
-                if desc is not None:
-                    return desc
-        if hasattr(self, "load_groups"):
-            for load_group in self.load_groups:
-                desc = load_group.get_description(obj)
-                if desc is not None:
-                    return desc
-        return None
+        """Get description of a given object.
+
+        Notes
+        -----
+        The descriptions are cached until the object or one of its children changes.
+        """
+        key = self._get_descriptions_key()
+        if self._all_descriptions_key != key:
+            self._all_descriptions = self._get_all_descriptions()
+            self._all_descriptions_key = key
+        return self._all_descriptions.get(obj)
+
+    def _get_all_descriptions(self) -> dict[object, str]:
+        """Get the descriptions of all objects of a model, including its children."""
+        descriptions = dict(self.descriptions)
+        for children in ("submodels", "connections", "load_groups"):
+            for child in getattr(self, children, ()):
+                for obj, desc in child._get_all_descriptions().items():
+                    descriptions.setdefault(obj, desc)
+        return descriptions
+
+    def _get_descriptions_key(self) -> tuple[int, ...]:
+        """Get the description versions of the object and its children."""
+        key = (self._descriptions_version,)
+        for children in ("submodels", "connections", "load_groups"):
+            for child in getattr(self, children, ()):
+                key += child._get_descriptions_key()
+        return key
+
+    def _invalidate_descriptions(self) -> None:
+        """Invalidate the cached descriptions of the object and its ancestors."""
+        self._descriptions_version += 1
 
     def get_all_symbols(self) -> set[Basic]:
         """Get all declared symbols of a model."""
@@ -251,6 +279,7 @@ class BrimBase:
     def define_objects(self) -> None:
         """Define the objects of the system."""
         self._define_objects()
+        self._invalidate_descriptions()
 
     def _define_kinematics(self) -> None:
         """Define the kinematics of the system."""
@@ -292,6 +321,8 @@ class ModelBase(BrimBase, metaclass=ModelMeta):
         super().__init__(name)
         self.is_root: bool | None = None  # None means that it is not defined.
         self._load_groups = []
+        self._submodels = None
+        self._connections = None
         for req in self.required_models:
             setattr(self, f"_{req.attribute_name}", None)
         for req in self.required_connections:
@@ -300,18 +331,22 @@ class ModelBase(BrimBase, metaclass=ModelMeta):
     @property
     def submodels(self) -> tuple[ModelBase]:
         """Submodels out of which this model exists."""
-        submodels = [
-            getattr(self, req.attribute_name) for req in self.required_models
-        ]
-        return tuple(smd for smd in submodels if smd is not None)
+        if self._submodels is None:
+            submodels = [
+                getattr(self, req.attribute_name) for req in self.required_models
+            ]
+            self._submodels = tuple(smd for smd in submodels if smd is not None)
+        return self._submodels
 
     @property
     def connections(self) -> tuple[ConnectionBase]:
         """Submodels out of which this model exists."""
-        connections = [
-            getattr(self, req.attribute_name) for req in self.required_connections
-        ]
-        return tuple(conn for conn in connections if conn is not None)
+        if self._connections is None:
+            connections = [
+                getattr(self, req.attribute_name) for req in self.required_connections
+            ]
+            self._connections = tuple(conn for conn in connections if conn is not None)
+        return self._connections
 
     @property
     def load_groups(self) -> tuple[LoadGroupBase]:
@@ -323,6 +358,7 @@ class ModelBase(BrimBase, metaclass=ModelMeta):
         for load_group in load_groups:
             load_group.parent = self
         self._load_groups.extend(load_groups)
+        self._invalidate_descriptions()
 
     @classmethod
     def from_convention(
@@ -374,6 +410,7 @@ class ModelBase(BrimBase, metaclass=ModelMeta):
             load_group.define_objects()
         if self.is_root:
             self._set_auxiliary_handler(AuxiliaryDataHandler.from_system(self.system))
+        self._invalidate_descriptions()
 
     def define_kinematics(self) -> None:
         """Establish the kinematics of the objects belonging to the model."""
@@ -447,16 +484,19 @@ class ConnectionBase(BrimBase, metaclass=ConnectionMeta):
         """
         super().__init__(name)
         self._load_groups = []
+        self._submodels = None
         for req in self.required_models:
             setattr(self, f"_{req.attribute_name}", None)
 
     @property
     def submodels(self) -> tuple[ModelBase]:
         """Submodels of the connection."""
-        submodels = tuple(
-            getattr(self, req.attribute_name) for req in self.required_models
-        )
-        return tuple(smd for smd in submodels if smd is not None)
+        if self._submodels is None:
+            submodels = tuple(
+                getattr(self, req.attribute_name) for req in self.required_models
+            )
+            self._submodels = tuple(smd for smd in submodels if smd is not None)
+        return self._submodels
 
     @property
     def load_groups(self) -> tuple[LoadGroupBase]:
@@ -468,12 +508,14 @@ class ConnectionBase(BrimBase, metaclass=ConnectionMeta):
         for load_group in load_groups:
             load_group.parent = self
         self._load_groups.extend(load_groups)
+        self._invalidate_descriptions()
 
     def define_objects(self) -> None:
         """Define the objects in the connection."""
         self._define_objects()
         for load_group in self._load_groups:
             load_group.define_objects()
+        self._invalidate_descriptions()
 
     def define_kinematics(self) -> None:
         """Define the kinematics of the connection."""
@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 import contextlib
+from functools import lru_cache
 from warnings import warn
 
 from sympy import Matrix, Symbol, symbols
@@ -20,6 +21,19 @@ from symbrim.bicycle.wheels import WheelBase
 from symbrim.core import ConnectionRequirement, ModelBase, ModelRequirement
 
 
+@lru_cache(maxsize=32)
+def _get_qd_repl(q: tuple, u: tuple) -> dict:
+    """Get the substitution dictionary of the coordinate derivatives to the speeds.
+
+    Notes
+    -----
+    The returned dictionary is shared between calls and should therefore not be
+    modified.
+    """
+    t = dynamicsymbols._t
+    return dict(zip((qi.diff(t) for qi in q), u))
+
+
 class RollingDisc(ModelBase):
     """Rolling disc model."""
 
@@ -76,28 +90,28 @@ class RollingDisc(ModelBase):
         self._system = System(self.ground.frame, self.ground.origin)
         self.tire.define_objects()
         self.tire.on_ground = True
-        self.q = Matrix([dynamicsymbols(self._add_prefix("q1:6"))])
-        self.u = Matrix([dynamicsymbols(self._add_prefix("u1:6"))])
+        qu = dynamicsymbols(self._add_prefix("q1:6 u1:6"))
+        self.q, self.u = Matrix([qu[:5]]), Matrix([qu[5:]])
 
     def _define_kinematics(self) -> None:
         """Define the kinematics of the rolling disc."""
         super()._define_kinematics()
-        qd_repl = dict(zip(self.q.diff(dynamicsymbols._t), self.u))
+        qd_repl = _get_qd_repl(tuple(self.q), tuple(self.u))
+        ground, ground_frame = self.ground, self.ground.frame
+        wheel_frame, contact_point = self.wheel.frame, self.tire.contact_point
         yaw_frame = ReferenceFrame("yaw_frame")
         roll_frame = ReferenceFrame("roll_frame")
-        yaw_frame.orient_axis(self.ground.frame, self.ground.frame.z, self.q[2])
+        yaw_frame.orient_axis(ground_frame, ground_frame.z, self.q[2])
         roll_frame.orient_axis(yaw_frame, yaw_frame.x, self.q[3])
-        self.wheel.frame.orient_axis(roll_frame, roll_frame.y, self.q[4])
-        self.wheel.frame.set_ang_vel(
-            self.ground.frame, self.wheel.frame.ang_vel_in(self.ground.frame).xreplace(
-                qd_repl))
-        self.ground.set_pos_point(self.tire.contact_point, self.q[:2])
-        self.tire.contact_point.set_vel(
-            self.ground.frame,
-            self.tire.contact_point.vel(self.ground.frame).xreplace(qd_repl))
+        wheel_frame.orient_axis(roll_frame, roll_frame.y, self.q[4])
+        wheel_frame.set_ang_vel(
+            ground_frame, wheel_frame.ang_vel_in(ground_frame).xreplace(qd_repl))
+        ground.set_pos_point(contact_point, self.q[:2])
+        contact_point.set_vel(
+            ground_frame, contact_point.vel(ground_frame).xreplace(qd_repl))
         with contextlib.suppress(ValueError):
-            normal = self.ground.get_normal(self.tire.contact_point)
-            direction = normal.dot(-self.ground.frame.z)
+            normal = ground.get_normal(contact_point)
+            direction = normal.dot(-ground_frame.z)
             self.tire.upward_radial_axis = direction * -roll_frame.z
             self.tire.longitudinal_axis = direction * yaw_frame.x
             self.tire.lateral_axis = yaw_frame.y
@@ -127,10 +141,9 @@ def rolling_disc_manual() -> System:
     copied from _create_rolling_disc in test_kane5.py from SymPy.
     """
     # Define symbols and coordinates
-    t = dynamicsymbols._t
     q = dynamicsymbols("q1:6")
     u = dynamicsymbols("u1:6")
-    qd_repl = {qi.diff(t): ui for qi, ui in zip(q, u)}
+    qd_repl = _get_qd_repl(tuple(q), tuple(u))
     # Define bodies and frames
     ground = RigidBody("ground")
     disc = RigidBody("disc", mass=Symbol("m"))
@@ -1,21 +1,30 @@
 """Module containing the hip joints."""
 from __future__ import annotations
 
+from typing import TYPE_CHECKING
+
 from sympy import Matrix, cos, sin
 from sympy.physics.mechanics import (
     PinJoint,
     SphericalJoint,
     System,
     Torque,
+    Vector,
     dynamicsymbols,
 )
 
 from symbrim.core import LoadGroupBase
 from symbrim.rider.base_connections import LeftHipBase, RightHipBase
 
+if TYPE_CHECKING:
+    from sympy import Expr
+
 __all__ = ["SphericalLeftHip", "SphericalRightHip", "PinRightHip", "PinLeftHip",
            "SphericalHipTorque", "SphericalHipSpringDamper"]
 
+_HIP_Q_NAMES = ("q_flexion", "q_adduction", "q_rotation")
+_HIP_U_NAMES = ("u_flexion", "u_adduction", "u_rotation")
+
 
 class SphericalHipMixin:
     """Spherical joint between the pelvis and the leg."""
@@ -36,16 +45,16 @@ class SphericalHipMixin:
     def _define_objects(self) -> None:
         """Define the objects."""
         super()._define_objects()
-        self.q = Matrix(
-            dynamicsymbols(self._add_prefix("q_flexion, q_adduction, q_rotation")))
-        self.u = Matrix(
-            dynamicsymbols(self._add_prefix("u_flexion, u_adduction, u_rotation")))
+        qu = dynamicsymbols(self._add_prefix(", ".join(_HIP_Q_NAMES + _HIP_U_NAMES)))
+        self.q, self.u = Matrix(qu[:3]), Matrix(qu[3:])
         self._system = System.from_newtonian(self.pelvis.body)
 
 
 class SphericalLeftHip(SphericalHipMixin, LeftHipBase):
     """Spherical joint between the pelvis and the left leg."""
 
+    _adduction_sign, _rotation_sign = -1, 1
+
     def _define_kinematics(self) -> None:
         """Define the kinematics."""
         super()._define_kinematics()
@@ -61,6 +70,8 @@ class SphericalLeftHip(SphericalHipMixin, LeftHipBase):
 class SphericalRightHip(SphericalHipMixin, RightHipBase):
     """Spherical joint between the pelvis and the right leg."""
 
+    _adduction_sign, _rotation_sign = 1, -1
+
     def _define_kinematics(self) -> None:
         """Define the kinematics."""
         super()._define_kinematics()
@@ -112,6 +123,25 @@ class PinRightHip(PinHipMixin, RightHipBase):
     """Pin joint between the pelvis and the right leg."""
 
 
+def _get_hip_torque(hip: SphericalLeftHip | SphericalRightHip, t_flexion: Expr,
+                    t_adduction: Expr, t_rotation: Expr) -> Vector:
+    """Get the torque vector applied by the pelvis on the leg in a spherical hip.
+
+    Explanation
+    -----------
+    The adduction axis is expanded in the parent interframe, such that the torque is
+    directly assembled as a single sum of basis vectors.
+    """
+    joint = hip.system.joints[0]
+    parent_frame = joint.parent_interframe
+    q_flexion = joint.coordinates[0]
+    t_adduction = hip._adduction_sign * t_adduction
+    return (t_adduction * cos(q_flexion) * parent_frame.x +
+            t_flexion * parent_frame.y -
+            t_adduction * sin(q_flexion) * parent_frame.z +
+            hip._rotation_sign * t_rotation * joint.child_interframe.z)
+
+
 class SphericalHipTorque(LoadGroupBase):
     """Torque for the spherical hip joints."""
 
@@ -130,22 +160,15 @@ class SphericalHipTorque(LoadGroupBase):
 
     def _define_objects(self) -> None:
         """Define the objects."""
-        self.symbols.update({name: dynamicsymbols(self._add_prefix(name)) for name in (
-            "T_flexion", "T_adduction", "T_rotation")})
+        names = ("T_flexion", "T_adduction", "T_rotation")
+        self.symbols.update(zip(names, dynamicsymbols(self._add_prefix(
+            ", ".join(names)))))
 
     def _define_loads(self) -> None:
         """Define the loads."""
         hip = self.parent.system.joints[0]
-        adduction_axis = (cos(hip.coordinates[0]) * hip.parent_interframe.x -
-                          sin(hip.coordinates[0]) * hip.parent_interframe.z)
-        if isinstance(self.parent, RightHipBase):
-            rot_dir = -1
-        else:
-            adduction_axis *= -1
-            rot_dir = 1
-        torque = (self.symbols["T_flexion"] * hip.parent_interframe.y +
-                  self.symbols["T_adduction"] * adduction_axis +
-                  self.symbols["T_rotation"] * rot_dir * hip.child_interframe.z)
+        torque = _get_hip_torque(self.parent, *(self.symbols[name] for name in (
+            "T_flexion", "T_adduction", "T_rotation")))
         self.parent.system.add_loads(
             Torque(hip.child_interframe, torque),
             Torque(hip.parent_interframe, -torque)
@@ -157,46 +180,39 @@ class SphericalHipSpringDamper(LoadGroupBase):
 
     parent: SphericalLeftHip | SphericalRightHip
     required_parent_type = (SphericalLeftHip, SphericalRightHip)
+    _description_templates = tuple(
+        (f"k_{tp}", f"c_{tp}", f"q_ref_{tp}", tp.capitalize())
+        for tp in ("flexion", "adduction", "rotation"))
 
     @property
     def descriptions(self) -> dict[object, str]:
         """Descriptions of the objects."""
         desc = {**super().descriptions}
-        for tp in ("flexion", "adduction", "rotation"):
-            desc.update({
-                self.symbols[f"k_{tp}"]:
-                    f"{tp.capitalize()} stiffness of hip: {self.parent}.",
-                self.symbols[f"c_{tp}"]:
-                    f"{tp.capitalize()} damping of hip: {self.parent}.",
-                self.symbols[f"q_ref_{tp}"]:
-                    f"{tp.capitalize()} reference angle of hip: {self.parent}.",
-            })
+        for k_name, c_name, q_ref_name, tp in self._description_templates:
+            desc[self.symbols[k_name]] = f"{tp} stiffness of hip: {self.parent}."
+            desc[self.symbols[c_name]] = f"{tp} damping of hip: {self.parent}."
+            desc[self.symbols[q_ref_name]] = (
+                f"{tp} reference angle of hip: {self.parent}.")
         return desc
 
     def _define_objects(self) -> None:
         """Define the objects."""
-        for tp in ("flexion", "adduction", "rotation"):
-            self.symbols.update({name: dynamicsymbols(self._add_prefix(name))
-                                 for name in (f"k_{tp}", f"c_{tp}", f"q_ref_{tp}")})
+        names = tuple(f"{name}_{tp}" for tp in ("flexion", "adduction", "rotation")
+                      for name in ("k", "c", "q_ref"))
+        self.symbols.update(zip(names, dynamicsymbols(self._add_prefix(
+            ", ".join(names)))))
 
     def _define_loads(self) -> None:
         """Define the loads."""
         hip = self.parent.system.joints[0]
-        adduction_axis = (cos(hip.coordinates[0]) * hip.parent_interframe.x -
-                          sin(hip.coordinates[0]) * hip.parent_interframe.z)
-        if isinstance(self.parent, RightHipBase):
-            rot_dir = -1
-        else:
-            adduction_axis *= -1
-            rot_dir = 1
-        torques = []
-        for i, tp in enumerate(("flexion", "adduction", "rotation")):
-            torques.append(-self.symbols[f"k_{tp}"] * (
-                    hip.coordinates[i] - self.symbols[f"q_ref_{tp}"]) -
-                           self.symbols[f"c_{tp}"] * hip.speeds[i])
-        torque = (torques[0] * hip.parent_interframe.y +
-                  torques[1] * adduction_axis +
-                  torques[2] * rot_dir * hip.child_interframe.z)
+        coordinates, speeds = hip.coordinates, hip.speeds
+        tps = ("flexion", "adduction", "rotation")
+        stiffnesses = [self.symbols[f"k_{tp}"] for tp in tps]
+        dampings = [self.symbols[f"c_{tp}"] for tp in tps]
+        q_refs = [self.symbols[f"q_ref_{tp}"] for tp in tps]
+        torques = [-k * (q - q_ref) - c * u for k, c, q_ref, q, u in zip(
+            stiffnesses, dampings, q_refs, coordinates, speeds)]
+        torque = _get_hip_torque(self.parent, *torques)
         self.parent.system.add_loads(
             Torque(hip.child_interframe, torque),
             Torque(hip.parent_interframe, -torque)
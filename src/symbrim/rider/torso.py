@@ -130,11 +130,10 @@ class PlanarTorso(TorsoBase):
     def _define_kinematics(self) -> None:
         """Define the kinematics."""
         super()._define_kinematics()
-        w, h = self.symbols["shoulder_width"], self.symbols["shoulder_height"]
-        self.left_shoulder_point.set_pos(self.body.masscenter,
-                                         -w / 2 * self.y - h * self.z)
-        self.right_shoulder_point.set_pos(self.body.masscenter,
-                                          w / 2 * self.y - h * self.z)
+        half_w = self.symbols["shoulder_width"] / 2
+        h_z = self.symbols["shoulder_height"] * self.z
+        self.left_shoulder_point.set_pos(self.body.masscenter, -half_w * self.y - h_z)
+        self.right_shoulder_point.set_pos(self.body.masscenter, half_w * self.y - h_z)
 
     @property
     def left_shoulder_frame(self) -> ReferenceFrame:
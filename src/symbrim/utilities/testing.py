@@ -5,6 +5,7 @@ from __future__ import annotations
 import os
 import warnings
 from contextlib import contextmanager
+from functools import cache
 from typing import TYPE_CHECKING
 
 from sympy.physics.mechanics import System
@@ -29,52 +30,62 @@ def _test_descriptions(instance: ModelBase | ConnectionBase | LoadGroupBase) ->
     else:
         instance.define_connections()
         instance.define_objects()
+    descriptions = instance.descriptions
     for sym in (*instance.symbols.values(), *instance.q, *instance.u, *instance.u_aux):
-        if sym not in instance.descriptions:
+        if sym not in descriptions:
             raise ValueError(f"Description missing for {sym}")
 
 
+def _define_connections_of_connection_model(self: ModelBase) -> None:
+    ModelBase._define_connections(self)
+    for req in self.conn.required_models:
+        model = getattr(self, req.attribute_name)
+        if model is not None:
+            setattr(self.conn, req.attribute_name, model)
+
+
+def _define_objects_of_connection_model(self: ModelBase) -> None:
+    ModelBase._define_objects(self)
+    for conn in self.connections:
+        conn.define_objects()
+    self._system = System(self.conn.system.frame, self.conn.system.fixed_point)
+
+
+def _define_kinematics_of_connection_model(self: ModelBase) -> None:
+    ModelBase._define_kinematics(self)
+    for conn in self.connections:
+        conn.define_kinematics()
+
+
+def _define_loads_of_connection_model(self: ModelBase) -> None:
+    ModelBase._define_loads(self)
+    for conn in self.connections:
+        conn.define_loads()
+
+
+def _define_constraints_of_connection_model(self: ModelBase) -> None:
+    ModelBase._define_constraints(self)
+    for conn in self.connections:
+        conn.define_constraints()
+
+
+@cache
 def create_model_of_connection(connection_cls: type[ConnectionBase]) -> type[ModelBase]:
-    """Create a model which uses the connection."""
-    required_connections = (ConnectionRequirement("conn", connection_cls),)
-    required_models = connection_cls.required_models
-
-    def _define_connections(self: ModelBase) -> None:
-        ModelBase._define_connections(self)
-        for req in self.conn.required_models:
-            model = getattr(self, req.attribute_name)
-            if model is not None:
-                setattr(self.conn, req.attribute_name, model)
-
-    def _define_objects(self: ModelBase) -> None:
-        ModelBase._define_objects(self)
-        for conn in self.connections:
-            conn.define_objects()
-        self._system = System(self.conn.system.frame, self.conn.system.fixed_point)
-
-    def _define_kinematics(self: ModelBase) -> None:
-        ModelBase._define_kinematics(self)
-        for conn in self.connections:
-            conn.define_kinematics()
-
-    def _define_loads(self: ModelBase) -> None:
-        ModelBase._define_loads(self)
-        for conn in self.connections:
-            conn.define_loads()
-
-    def _define_constraints(self: ModelBase) -> None:
-        ModelBase._define_constraints(self)
-        for conn in self.connections:
-            conn.define_constraints()
+    """Create a model which uses the connection.
 
+    Explanation
+    -----------
+    The created model class is cached per connection class, such that repeated calls
+    return the same class. Each instantiation still results in an independent model.
+    """
     return type("MyModel", (ModelBase,), {
-        "required_connections": required_connections,
-        "required_models": required_models,
-        "define_connections": _define_connections,
-        "_define_objects": _define_objects,
-        "_define_kinematics": _define_kinematics,
-        "_define_loads": _define_loads,
-        "_define_constraints": _define_constraints,
+        "required_connections": (ConnectionRequirement("conn", connection_cls),),
+        "required_models": connection_cls.required_models,
+        "define_connections": _define_connections_of_connection_model,
+        "_define_objects": _define_objects_of_connection_model,
+        "_define_kinematics": _define_kinematics_of_connection_model,
+        "_define_loads": _define_loads_of_connection_model,
+        "_define_constraints": _define_constraints_of_connection_model,
     })
 
 @contextmanager
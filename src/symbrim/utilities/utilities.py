@@ -53,6 +53,9 @@ def check_zero(expr: Expr, n_evaluations: int = 10, atol: float = 1e-8) -> bool:
     """
     if not isinstance(expr, Basic):
         return expr == 0
+    if expr == 0:
+        # Skip the lambdification of expressions that are already structurally zero.
+        return True
     free = tuple(expr.free_symbols.union(find_dynamicsymbols(expr)))
     if any(isinstance(f, Derivative) for f in free):
         dummy_map = {f: Dummy() for f in free if isinstance(f, Derivative)}
@@ -14,22 +14,29 @@ except ImportError:
     PlotModel = None
 
 
+@pytest.fixture(scope="module")
+def defined_flat_ground() -> FlatGround:
+    ground = FlatGround("ground")
+    ground.define_objects()
+    return ground
+
+
 class TestFlatGround:
     @pytest.fixture
     def _setup(self) -> None:
         self.ground = FlatGround("ground")
         self.ground.define_objects()
 
-    @pytest.mark.usefixtures("_setup")
-    def test_default(self) -> None:
-        assert self.ground.name == "ground"
-        assert self.ground.frame == self.ground.body.frame
-        assert self.ground.get_normal(self.ground.origin) == -self.ground.frame.z
-        assert self.ground.get_tangent_vectors(self.ground.origin) == (
-            self.ground.frame.x, self.ground.frame.y)
-        assert self.ground.origin == self.ground.body.masscenter
-        assert self.ground.origin.vel(self.ground.frame) == 0
-        assert isinstance(self.ground.system, System)
+    def test_default(self, defined_flat_ground) -> None:
+        ground = defined_flat_ground
+        assert ground.name == "ground"
+        assert ground.frame == ground.body.frame
+        assert ground.get_normal(ground.origin) == -ground.frame.z
+        assert ground.get_tangent_vectors(ground.origin) == (
+            ground.frame.x, ground.frame.y)
+        assert ground.origin == ground.body.masscenter
+        assert ground.origin.vel(ground.frame) == 0
+        assert isinstance(ground.system, System)
 
     @pytest.mark.parametrize(("normal", "n_idx", "pl_idx1", "pl_idx2"), [
         ("+x", 0, 1, 2),
@@ -59,10 +66,8 @@ class TestFlatGround:
     @pytest.mark.usefixtures("_setup")
     def test_parse_plane_position(self, tp, position, expected) -> None:
         if tp in ("vector", "point"):
-            position = Vector(0)
-            for i, v in enumerate("xyz"):
-                if i < len(expected):
-                    position += expected[i] * self.ground.frame[v]
+            position = sum((coord * axis for coord, axis in zip(
+                expected, self.ground.frame)), Vector(0))
         if tp == "point":
             position = self.ground.origin.locatenew("p", position)
         assert self.ground._parse_plane_position(position) == expected
@@ -70,10 +75,9 @@ class TestFlatGround:
     @pytest.mark.parametrize("position", [
         (Symbol("x"), Symbol("y"), Symbol("z"), Symbol("w")),
         (Symbol("x"), )])
-    @pytest.mark.usefixtures("_setup")
-    def test_parse_plane_position_error(self, position) -> None:
+    def test_parse_plane_position_error(self, defined_flat_ground, position) -> None:
         with pytest.raises(ValueError):
-            self.ground._parse_plane_position(position)
+            defined_flat_ground._parse_plane_position(position)
 
     @pytest.mark.skipif(PlotModel is None, reason="symmeplot not installed")
     def test_plotting(self):
@@ -1,7 +1,9 @@
 from __future__ import annotations
 
+from typing import TYPE_CHECKING
+
 import pytest
-from sympy import Matrix, S, cos, linear_eq_to_matrix, pi, simplify, sin, symbols
+from sympy import S, cos, lambdify, pi, sin, symbols
 from sympy.physics.mechanics import ReferenceFrame, System, cross, dynamicsymbols
 
 from symbrim.bicycle.grounds import FlatGround, GroundBase
@@ -11,18 +13,44 @@ from symbrim.other.rolling_disc import RollingDisc
 from symbrim.utilities.testing import _test_descriptions, create_model_of_connection
 from symbrim.utilities.utilities import check_zero
 
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+
+Q = dynamicsymbols("q1:4")
+
 
 class MyTire(TireBase):
     pass
 
 
+class NewGround(GroundBase):
+    def get_normal(self, position):
+        return -self.body.z
+
+    def get_tangent_vectors(self, position):
+        return (self.frame.x, self.frame.y)
+
+    def set_pos_point(self, point, position) -> None:
+        point.set_pos(self.origin, position[0] * self.frame.x +
+                      position[1] * self.frame.y)
+
+
+class NewWheel(WheelBase):
+    @property
+    def center(self):
+        return self.body.masscenter
+
+    def rotation_axis(self):
+        return self.frame.y
+
+
 class TestTireBase:
     @pytest.fixture
     def _setup_flat_ground(self):
         self.ground = FlatGround("ground")
         self.ground.define_objects()
-        self.ground.define_kinematics()
-        self.q = dynamicsymbols("q1:4")
+        self.q = Q
         self.yaw_frame = ReferenceFrame("yaw_frame")
         self.yaw_frame.orient_axis(self.ground.frame, self.q[0], self.ground.frame.z)
         self.roll_frame = ReferenceFrame("roll_frame")
@@ -42,11 +70,9 @@ class TestTireBase:
     @pytest.mark.usefixtures("_setup_knife_edge_wheel")
     def test_knife_edge_wheel_on_flat_ground(self):
         self.tire._set_pos_contact_point()
-        assert (self.tire.contact_point.pos_from(self.wheel.center) -
-                self.wheel.symbols["r"] * self.roll_frame.z).express(
-                    self.wheel.frame).simplify().xreplace(
-                        {self.q[1]: 0.123, self.q[2]: 1.234}) == 0
-        # sqrt(cos(q2)**2) is not simplified  # noqa: ERA001
+        error = (self.tire.contact_point.pos_from(self.wheel.center) -
+                 self.wheel.symbols["r"] * self.roll_frame.z)
+        assert all(check_zero(error.dot(axis)) for axis in self.roll_frame)
 
     @pytest.mark.usefixtures("_setup_flat_ground")
     def test_toroidal_wheel_on_flat_ground(self) -> None:
@@ -56,52 +82,32 @@ class TestTireBase:
         self.tire.wheel = wheel
         wheel.frame.orient_axis(self.roll_frame, self.q[2], self.roll_frame.y)
         self.tire._set_pos_contact_point()
-        assert (self.tire.contact_point.pos_from(wheel.center) -
-                wheel.symbols["r"] * self.roll_frame.z + wheel.symbols["tr"] *
-                self.ground.get_normal(self.tire.contact_point)).express(
-            wheel.frame).simplify().xreplace({self.q[1]: 0.123, self.q[2]: 1.234}) == 0
-        # sqrt(cos(q2)**2) is not simplified  # noqa: ERA001
-
-    def test_not_implemented_combinations(self) -> None:
-        class NewGround(GroundBase):
-            def get_normal(self, position):
-                return -self.body.z
-
-            def get_tangent_vectors(self, position):
-                return (self.frame.x, self.frame.y)
-
-            def set_pos_point(self, point, position) -> None:
-                point.set_pos(self.origin, position[0] * self.frame.x +
-                              position[1] * self.frame.y)
-
-        class NewWheel(WheelBase):
-            @property
-            def center(self):
-                return self.body.masscenter
-
-            def rotation_axis(self):
-                return self.frame.y
-
-        for wheel_cls, ground_cls in [(KnifeEdgeWheel, NewGround),
-                                      (NewWheel, FlatGround),
-                                      (NewWheel, NewGround)]:
-            tire = MyTire("tire")
-            tire.ground = ground_cls("ground")
-            tire.wheel = wheel_cls("wheel")
-            tire.ground.define_objects()
-            tire.wheel.define_objects()
-            tire.define_objects()
-            tire.ground.define_kinematics()
-            tire.wheel.define_kinematics()
-            with pytest.raises(NotImplementedError):
-                tire._set_pos_contact_point()
+        error = (self.tire.contact_point.pos_from(wheel.center) -
+                 wheel.symbols["r"] * self.roll_frame.z + wheel.symbols["tr"] *
+                 self.ground.get_normal(self.tire.contact_point))
+        assert all(check_zero(error.dot(axis)) for axis in self.roll_frame)
+
+    @pytest.mark.parametrize(("wheel_cls", "ground_cls"), [
+        (KnifeEdgeWheel, NewGround), (NewWheel, FlatGround), (NewWheel, NewGround)])
+    def test_not_implemented_combinations(self, wheel_cls, ground_cls) -> None:
+        tire = MyTire("tire")
+        tire.ground = ground_cls("ground")
+        tire.wheel = wheel_cls("wheel")
+        tire.ground.define_objects()
+        tire.wheel.define_objects()
+        tire.define_objects()
+        tire.ground.define_kinematics()
+        tire.wheel.define_kinematics()
+        with pytest.raises(NotImplementedError):
+            tire._set_pos_contact_point()
 
     @pytest.mark.usefixtures("_setup_knife_edge_wheel")
     def test_upward_radial_axis(self):
         self.tire.upward_radial_axis = -self.roll_frame.z
         self.tire._set_pos_contact_point()
-        assert (self.tire.contact_point.pos_from(self.wheel.center) -
-                self.wheel.symbols["r"] * self.roll_frame.z).simplify() == 0
+        error = (self.tire.contact_point.pos_from(self.wheel.center) -
+                 self.wheel.symbols["r"] * self.roll_frame.z)
+        assert all(check_zero(error.dot(axis)) for axis in self.roll_frame)
 
     @pytest.mark.usefixtures("_setup_knife_edge_wheel")
     def test_upward_radial_axis_invalid(self):
@@ -180,10 +186,32 @@ class TestTireBase:
         self.tire._set_pos_contact_point()
         self.tire.contact_point.set_pos(
             self.ground.origin,
-            int(off_ground) * dynamicsymbols("q3") * self.ground.frame.z)
+            int(off_ground) * self.q[2] * self.ground.frame.z)
         assert self.tire.on_ground != off_ground
 
 
+@pytest.fixture(scope="module")
+def defined_rolling_disc() -> RollingDisc:
+    model = RollingDisc("model")
+    model.ground = FlatGround("ground")
+    model.wheel = KnifeEdgeWheel("wheel")
+    model.tire = InContactTire("tire")
+    model.define_all()
+    return model
+
+
+@pytest.fixture(scope="module")
+def camber_angle_func(defined_rolling_disc) -> Callable[[float], float]:
+    return lambdify(defined_rolling_disc.q[3], defined_rolling_disc.tire.camber_angle,
+                    cse=True)
+
+
+@pytest.fixture(scope="module")
+def slip_angle_func(defined_rolling_disc) -> Callable[[float, float, float], float]:
+    return lambdify((defined_rolling_disc.q[2], *defined_rolling_disc.u[:2]),
+                    defined_rolling_disc.tire.slip_angle, cse=True)
+
+
 class TestInContactTire:
     @pytest.fixture
     def _setup_rolling_disc(self) -> None:
@@ -243,26 +271,17 @@ class TestInContactTire:
         self.model.define_all()
         assert len(self.tire.system.nonholonomic_constraints) == n_constraints
 
-    @pytest.mark.parametrize(("subs", "angle"), [
-        ("{q4: 0}", 0), ("{q4: 0.5}", 0.5), ("{q4: -0.5}", -0.5)])
-    @pytest.mark.usefixtures("_setup_rolling_disc")
-    def test_camber_angle(self, subs, angle) -> None:
-        self.model.define_all()
-        q3, q4, q5 = self.model.q[2:]
-        subs = eval(subs)  # noqa: S307
-        assert self.tire.camber_angle.subs(subs) == angle
-
-    @pytest.mark.parametrize(("subs", "angle"), [
-        ("{q3: 0, u1: 1, u2: 0}", 0), ("{q3: 0, u1: 0, u2: 1}", -pi / 2),
-        ("{q3: 0, u1: 0, u2: -1}", pi / 2), ("{q3: pi/4, u1: 1, u2: 1}", 0),
-        ("{q3: -pi/4, u1: 1, u2: 1}", -pi / 2),
+    @pytest.mark.parametrize("angle", [0, 0.5, -0.5])
+    def test_camber_angle(self, camber_angle_func, angle) -> None:
+        assert camber_angle_func(angle) == pytest.approx(angle)
+
+    @pytest.mark.parametrize(("q3_val", "u1_val", "u2_val", "angle"), [
+        (0, 1, 0, 0), (0, 0, 1, -pi / 2), (0, 0, -1, pi / 2), (pi / 4, 1, 1, 0),
+        (-pi / 4, 1, 1, -pi / 2),
         ])
-    @pytest.mark.usefixtures("_setup_rolling_disc")
-    def test_slip_angle(self, subs, angle) -> None:
-        self.model.define_all()
-        q3, (u1, u2) = self.model.q[2], self.model.u[:2]  # noqa: F841
-        subs = eval(subs)  # noqa: S307
-        assert self.tire.slip_angle.subs(subs) == angle
+    def test_slip_angle(self, slip_angle_func, q3_val, u1_val, u2_val, angle) -> None:
+        assert slip_angle_func(float(q3_val), u1_val, u2_val) == pytest.approx(
+            float(angle))
 
     @pytest.mark.parametrize("no_slip", [True, False])
     @pytest.mark.usefixtures("_setup_rolling_disc")
@@ -279,19 +298,19 @@ class TestInContactTire:
             system.u_dep = self.model.u[:2]
         system.validate_system()
         system.form_eoms()
-        aux_eq = system.eom_method.auxiliary_eqs
-        fn_eq = Matrix.cramer_solve(*linear_eq_to_matrix(
-            aux_eq, self.tire.symbols["Fz"]))[0]
+        (aux_eq,) = system.eom_method.auxiliary_eqs
+        fz = self.tire.symbols["Fz"]
+        fn_eq = -aux_eq.xreplace({fz: 0}) / aux_eq.diff(fz)
         m, r = self.model.wheel.body.mass, self.model.wheel.radius
         q4, u4 = self.model.q[3], self.model.u[3]
         fn_eq_expected = m * (g - r * (u4 ** 2 * cos(q4) + sin(q4) * u4.diff()))
-        assert simplify(fn_eq - fn_eq_expected) == 0
+        assert check_zero(fn_eq - fn_eq_expected)
 
     @pytest.mark.parametrize(("load_str", "location", "direction"), [
-        ("Fx", "self.tire.contact_point", "self.tire.longitudinal_axis"),
-        ("Fy", "self.tire.contact_point", "self.tire.lateral_axis"),
-        ("Mx", "self.wheel.frame", "self.tire.longitudinal_axis"),
-        ("Mz", "self.wheel.frame", "self.ground.frame.z"),
+        ("Fx", lambda t: t.tire.contact_point, lambda t: t.tire.longitudinal_axis),
+        ("Fy", lambda t: t.tire.contact_point, lambda t: t.tire.lateral_axis),
+        ("Mx", lambda t: t.wheel.frame, lambda t: t.tire.longitudinal_axis),
+        ("Mz", lambda t: t.wheel.frame, lambda t: t.ground.frame.z),
         ])
     @pytest.mark.usefixtures("_setup_rolling_disc")
     def test_apply_single_load(self, load_str, location, direction) -> None:
@@ -306,8 +325,7 @@ class TestInContactTire:
         self.model.define_loads()
         self.model.define_constraints()
         system = self.model.to_system()
-        location = eval(location)  # noqa: S307
-        direction = eval(direction)  # noqa: S307
+        location, direction = location(self), direction(self)
         assert len(system.loads) == 1
         load = system.loads[0]
         assert load.location is location
@@ -386,7 +404,6 @@ class TestNonHolonomicTire:
         assert len(tire_model.system.holonomic_constraints) == int(not on_ground)
         assert len(tire_model.system.nonholonomic_constraints) == 2
         if not on_ground:
-            assert (tire_model.system.holonomic_constraints[0] - z
-                    ).simplify() == 0
+            assert check_zero(tire_model.system.holonomic_constraints[0] - z)
         for fnhi in tire_model.system.nonholonomic_constraints:
-            assert (fnhi - fnh[0]).simplify() == 0 or (fnhi - fnh[1]).simplify() == 0
+            assert check_zero(fnhi - fnh[0]) or check_zero(fnhi - fnh[1])
@@ -119,24 +119,20 @@ class TestCompleteBicycleRider:
     def test_form_eoms(self) -> None:
         self.br.define_all()
         system = self.br.to_system()
-        system.q_ind = [*self.bicycle.q[:4], *self.bicycle.q[5:],
-                        self.rider.left_hip.q[0], self.rider.left_leg.q[0],
-                        self.rider.right_hip.q[0], self.rider.right_leg.q[0],
-                        *self.rider.left_arm.q, *self.rider.right_arm.q,
-                        *self.br.seat.q]
-        system.q_dep = [self.bicycle.q[4],
-                        *self.rider.left_hip.q[1:], self.rider.left_leg.q[1],
-                        *self.rider.right_hip.q[1:], self.rider.right_leg.q[1],
-                        *self.rider.left_shoulder.q, *self.rider.right_shoulder.q]
-        system.u_ind = [self.bicycle.u[3], *self.bicycle.u[5:7],
-                        self.rider.left_hip.u[0], self.rider.left_leg.u[0],
-                        self.rider.right_hip.u[0], self.rider.right_leg.u[0],
-                        *self.rider.left_arm.u, *self.rider.right_arm.u,
-                        *self.br.seat.u]
-        system.u_dep = [*self.bicycle.u[:3], self.bicycle.u[4], self.bicycle.u[7],
-                        *self.rider.left_hip.u[1:], self.rider.left_leg.u[1],
-                        *self.rider.right_hip.u[1:], self.rider.right_leg.u[1],
-                        *self.rider.left_shoulder.u, *self.rider.right_shoulder.u]
+        bq, bu = self.bicycle.q, self.bicycle.u
+        rider = self.rider
+        lhq, lhu = rider.left_hip.q, rider.left_hip.u
+        rhq, rhu = rider.right_hip.q, rider.right_hip.u
+        llq, llu = rider.left_leg.q, rider.left_leg.u
+        rlq, rlu = rider.right_leg.q, rider.right_leg.u
+        system.q_ind = [*bq[:4], *bq[5:], lhq[0], llq[0], rhq[0], rlq[0],
+                        *rider.left_arm.q, *rider.right_arm.q, *self.br.seat.q]
+        system.q_dep = [bq[4], *lhq[1:], llq[1], *rhq[1:], rlq[1],
+                        *rider.left_shoulder.q, *rider.right_shoulder.q]
+        system.u_ind = [bu[3], *bu[5:7], lhu[0], llu[0], rhu[0], rlu[0],
+                        *rider.left_arm.u, *rider.right_arm.u, *self.br.seat.u]
+        system.u_dep = [*bu[:3], bu[4], bu[7], *lhu[1:], llu[1], *rhu[1:], rlu[1],
+                        *rider.left_shoulder.u, *rider.right_shoulder.u]
         system.validate_system()
         with ignore_point_warnings():
             system.form_eoms()
@@ -2,13 +2,14 @@ from __future__ import annotations
 
 import pytest
 from sympy import Symbol
-from sympy.physics.mechanics import Vector, dynamicsymbols
+from sympy.physics.mechanics import dynamicsymbols
 
 from symbrim.bicycle.front_frames import RigidFrontFrameMoore
 from symbrim.brim.base_connections import HandGripsBase
 from symbrim.brim.hand_grips import HolonomicHandGrips, SpringDamperHandGrips
 from symbrim.rider.arms import PinElbowStickLeftArm, PinElbowStickRightArm
 from symbrim.utilities.testing import _test_descriptions, create_model_of_connection
+from symbrim.utilities.utilities import check_zero
 
 
 @pytest.mark.parametrize("hand_grip_cls", [HolonomicHandGrips, SpringDamperHandGrips])
@@ -22,19 +23,19 @@ class TestSteerConnectionBase:
         self.model.conn = hand_grip_cls("steer_connection")
         self.model.define_connections()
         self.model.define_objects()
-        self.steer_frame = self.model.front_frame.steer_hub.frame
+        front_frame = self.model.front_frame
+        self.steer_frame = front_frame.steer_hub.frame
+        steer_axis = front_frame.steer_hub.axis
         # Define kinematics with enough degrees of freedom
         self.q = dynamicsymbols("q1:5")
         self.model.left_arm.hand_interframe.orient_axis(
-            self.steer_frame, self.model.front_frame.steer_hub.axis, self.q[0])
+            self.steer_frame, steer_axis, self.q[0])
         self.model.left_arm.shoulder_interpoint.set_pos(
-            self.model.front_frame.left_hand_grip.point,
-            self.q[1] * self.model.front_frame.steer_hub.axis)
+            front_frame.left_hand_grip.point, self.q[1] * steer_axis)
         self.model.right_arm.hand_interframe.orient_axis(
-            self.steer_frame, self.model.front_frame.steer_hub.axis, self.q[2])
+            self.steer_frame, steer_axis, self.q[2])
         self.model.right_arm.shoulder_interpoint.set_pos(
-            self.model.front_frame.right_hand_grip.point,
-            self.q[3] * self.model.front_frame.steer_hub.axis)
+            front_frame.right_hand_grip.point, self.q[3] * steer_axis)
         self.model.define_kinematics()
         self.model.define_loads()
         self.model.define_constraints()
@@ -58,11 +59,10 @@ class TestSteerConnectionBase:
         model.define_objects()
         # Define kinematics with enough degrees of freedom
         q = dynamicsymbols("q1:3")
-        getattr(model, side + "_arm").hand_interframe.orient_axis(
-            model.front_frame.steer_hub.frame, model.front_frame.steer_hub.axis, q[0])
-        getattr(model, side + "_arm").shoulder_interpoint.set_pos(
-            model.front_frame.left_hand_grip.point,
-            q[1] * model.front_frame.steer_hub.axis)
+        arm, steer_hub = getattr(model, side + "_arm"), model.front_frame.steer_hub
+        arm.hand_interframe.orient_axis(steer_hub.frame, steer_hub.axis, q[0])
+        arm.shoulder_interpoint.set_pos(
+            model.front_frame.left_hand_grip.point, q[1] * steer_hub.axis)
         model.define_kinematics()
         model.define_loads()
         model.define_constraints()
@@ -79,22 +79,20 @@ class TestHolonomicHandGrip:
         self.model.define_connections()
         self.model.define_objects()
         self.steer_frame = self.model.front_frame.steer_hub.frame
-        self.model.left_arm.hand_interframe.orient_axis(
-            self.steer_frame, self.model.front_frame.steer_hub.axis, 0)
-        self.model.right_arm.hand_interframe.orient_axis(
-            self.steer_frame, self.model.front_frame.steer_hub.axis, 0)
+        steer_axis = self.model.front_frame.steer_hub.axis
+        for arm in (self.model.left_arm, self.model.right_arm):
+            arm.hand_interframe.orient_axis(self.steer_frame, steer_axis, 0)
         self.front_frame, self.left_arm, self.right_arm, self.conn = (
             self.model.front_frame, self.model.left_arm, self.model.right_arm,
             self.model.conn)
 
     def test_all_constraints(self) -> None:
         q = dynamicsymbols("q1:7")
+        x, y, z = self.steer_frame
         self.left_arm.hand_interpoint.set_pos(
-            self.front_frame.left_hand_grip.point,
-            sum(qi * v for qi, v in zip(q[:3], self.steer_frame)))
+            self.front_frame.left_hand_grip.point, q[0] * x + q[1] * y + q[2] * z)
         self.right_arm.hand_interpoint.set_pos(
-            self.front_frame.right_hand_grip.point,
-            sum(qi * v for qi, v in zip(q[3:], self.steer_frame)))
+            self.front_frame.right_hand_grip.point, q[3] * x + q[4] * y + q[5] * z)
         self.model.define_kinematics()
         self.model.define_loads()
         self.model.define_constraints()
@@ -142,10 +140,9 @@ class TestSpringDamperHandGrip:
         self.model.define_connections()
         self.model.define_objects()
         self.steer_frame = self.model.front_frame.steer_hub.frame
-        self.model.left_arm.hand_interframe.orient_axis(
-            self.steer_frame, self.model.front_frame.steer_hub.axis, 0)
-        self.model.right_arm.hand_interframe.orient_axis(
-            self.steer_frame, self.model.front_frame.steer_hub.axis, 0)
+        steer_axis = self.model.front_frame.steer_hub.axis
+        for arm in (self.model.left_arm, self.model.right_arm):
+            arm.hand_interframe.orient_axis(self.steer_frame, steer_axis, 0)
         self.front_frame, self.left_arm, self.right_arm, self.conn = (
             self.model.front_frame, self.model.left_arm, self.model.right_arm,
             self.model.conn)
@@ -172,15 +169,13 @@ class TestSpringDamperHandGrip:
         k, c = self.conn.symbols["k"], self.conn.symbols["c"]
         for ld in loads:
             if ld.location == self.front_frame.left_hand_grip.point:
-                assert (ld.vector - (k * q1 + c * q1.diff()) * self.steer_frame.x
-                        ).simplify() == Vector(0)
+                expected = (k * q1 + c * q1.diff()) * self.steer_frame.x
             elif ld.location == self.left_arm.hand_interpoint:
-                assert (ld.vector + (k * q1 + c * q1.diff()) * self.steer_frame.x
-                        ).simplify() == Vector(0)
+                expected = -(k * q1 + c * q1.diff()) * self.steer_frame.x
             elif ld.location == self.front_frame.right_hand_grip.point:
-                assert (ld.vector - (-k * q2 - c * q2.diff()) * self.steer_frame.y
-                        ).simplify() == Vector(0)
+                expected = (-k * q2 - c * q2.diff()) * self.steer_frame.y
             else:
                 assert ld.location == self.right_arm.hand_interpoint
-                assert (ld.vector + (-k * q2 - c * q2.diff()) * self.steer_frame.y
-                        ).simplify() == Vector(0)
+                expected = -(-k * q2 - c * q2.diff()) * self.steer_frame.y
+            assert all(check_zero((ld.vector - expected).dot(axis))
+                       for axis in self.steer_frame)
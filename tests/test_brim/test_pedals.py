@@ -1,14 +1,24 @@
 from __future__ import annotations
 
+from collections import defaultdict
+
 import pytest
 from sympy import Symbol
-from sympy.physics.mechanics import Vector, dynamicsymbols
+from sympy.physics.mechanics import (
+    Force,
+    Vector,
+    dynamicsymbols,
+    find_dynamicsymbols,
+)
 
 from symbrim.bicycle.cranks import MasslessCranks
 from symbrim.brim.base_connections import PedalsBase
 from symbrim.brim.pedals import HolonomicPedals, SpringDamperPedals
 from symbrim.rider.legs import TwoPinStickLeftLeg, TwoPinStickRightLeg
 from symbrim.utilities.testing import _test_descriptions, create_model_of_connection
+from symbrim.utilities.utilities import check_zero
+
+Q = dynamicsymbols("q1:7")
 
 
 @pytest.mark.parametrize("pedal_cls", [HolonomicPedals, SpringDamperPedals])
@@ -23,7 +33,7 @@ class TestPedalsBase:
         self.model.define_connections()
         self.model.define_objects()
         # Define kinematics with enough degrees of freedom
-        self.q = dynamicsymbols("q1:5")
+        self.q = Q[:4]
         self.model.left_leg.hip_interframe.orient_axis(
             self.model.cranks.frame, self.model.cranks.rotation_axis, self.q[0])
         self.model.left_leg.hip_interpoint.set_pos(
@@ -56,7 +66,7 @@ class TestPedalsBase:
         self.model.define_connections()
         self.model.define_objects()
         # Define kinematics with enough degrees of freedom
-        self.q = dynamicsymbols("q1:3")
+        self.q = Q[:2]
         getattr(self.model, f"{side}_leg").hip_interframe.orient_axis(
             self.model.cranks.frame, self.model.cranks.rotation_axis, self.q[0])
         getattr(self.model, f"{side}_leg").hip_interpoint.set_pos(
@@ -86,23 +96,21 @@ class TestHolonomicPedals:
             self.model.conn)
 
     def test_all_constraints(self) -> None:
-        q = dynamicsymbols("q1:7")
+        q, (x, y, z) = Q, self.cranks.frame
         self.left_leg.foot_interpoint.set_pos(
-            self.cranks.left_pedal_point,
-            sum(qi * v for qi, v in zip(q[:3], self.cranks.frame)))
+            self.cranks.left_pedal_point, q[0] * x + q[1] * y + q[2] * z)
         self.right_leg.foot_interpoint.set_pos(
-            self.cranks.right_pedal_point,
-            sum(qi * v for qi, v in zip(q[3:], self.cranks.frame)))
+            self.cranks.right_pedal_point, q[3] * x + q[4] * y + q[5] * z)
         self.model.define_kinematics()
         self.model.define_loads()
         self.model.define_constraints()
         assert len(self.conn.system.holonomic_constraints) == 6
-        expected_constraints = list(q)
+        remaining = set(q)
         for constr in self.conn.system.holonomic_constraints:
-            for exp_constr in expected_constraints:
-                if constr.xreplace({exp_constr: 0}) == 0:
-                    expected_constraints.remove(exp_constr)
-        assert not expected_constraints
+            (qi,) = find_dynamicsymbols(constr)
+            assert constr.xreplace({qi: 0}) == 0
+            remaining.remove(qi)
+        assert not remaining
 
     def test_not_fully_constraint(self) -> None:
         q, d = dynamicsymbols("q"), Symbol("d")
@@ -148,36 +156,30 @@ class TestSpringDamperPedals:
             self.model.conn)
 
     def test_loads(self) -> None:
-        q1, q2 = dynamicsymbols("q1:3")
+        q1, q2 = Q[:2]
+        frame = self.cranks.frame
         self.left_leg.foot_interpoint.set_pos(
-            self.cranks.left_pedal_point, q1 * self.cranks.frame.x)
+            self.cranks.left_pedal_point, q1 * frame.x)
         self.right_leg.foot_interpoint.set_pos(
-            self.cranks.right_pedal_point, -q2 * self.cranks.frame.y)
+            self.cranks.right_pedal_point, -q2 * frame.y)
         self.model.define_kinematics()
         self.model.define_loads()
         self.model.define_constraints()
         loads_indi = [ld for act in self.conn.system.actuators for ld in act.to_loads()]
-        locations, loads = {}, []
+        vectors = defaultdict(lambda: Vector(0))
         for ld in loads_indi:
-            if ld.location not in locations:
-                locations[ld.location] = len(loads)
-                loads.append(ld)
-            else:
-                loads[locations[ld.location]] = ld.__class__(
-                    ld.location, ld.vector + loads[locations[ld.location]].vector)
+            vectors[ld.location] += ld.vector
+        loads = [Force(location, vector) for location, vector in vectors.items()]
         assert len(loads) == 4
         k, c = self.conn.symbols["k"], self.conn.symbols["c"]
+        f_left = (k * q1 + c * q1.diff()) * frame.x
+        f_right = (-k * q2 - c * q2.diff()) * frame.y
+        expected = {
+            self.cranks.left_pedal_point: f_left,
+            self.left_leg.foot_interpoint: -f_left,
+            self.cranks.right_pedal_point: f_right,
+            self.right_leg.foot_interpoint: -f_right,
+        }
         for ld in loads:
-            if ld.location == self.cranks.left_pedal_point:
-                assert (ld.vector - (k * q1 + c * q1.diff()) * self.cranks.frame.x
-                        ).simplify() == Vector(0)
-            elif ld.location == self.left_leg.foot_interpoint:
-                assert (ld.vector + (k * q1 + c * q1.diff()) * self.cranks.frame.x
-                        ).simplify() == Vector(0)
-            elif ld.location == self.cranks.right_pedal_point:
-                assert (ld.vector - (-k * q2 - c * q2.diff()) * self.cranks.frame.y
-                        ).simplify() == Vector(0)
-            else:
-                assert ld.location == self.right_leg.foot_interpoint
-                assert (ld.vector + (-k * q2 - c * q2.diff()) * self.cranks.frame.y
-                        ).simplify() == Vector(0)
+            assert all(check_zero((ld.vector - expected[ld.location]).dot(axis))
+                       for axis in frame)
@@ -82,11 +82,23 @@ class TestModelBase:
         assert disc.ground is None
         assert disc.tire is None
 
-    @pytest.mark.parametrize("name", ["", " ", "my model", "my,model", "my:model"])
+    @pytest.mark.parametrize("name", ["", " ", "my model", "my,model", "my:model", 5])
     def test_invalid_name(self, name) -> None:
         with pytest.raises(ValueError):
             RollingDisc(name)
 
+    @pytest.mark.parametrize(("names", "expected"), [
+        ("a", "model_a"),
+        ("a, b,c", "model_a, model_b, model_c"),
+        ("ixx iyy ixx", "model_ixx, model_iyy, model_ixx"),
+        ("q1:4", "model_q1, model_q2, model_q3"),
+        ("q1:3 u1:3", "model_q1, model_q2, model_u1, model_u2"),
+        ("x:2", "model_x0, model_x1"),
+        ("a:c", "model_a, model_b, model_c"),
+    ])
+    def test_add_prefix(self, names, expected) -> None:
+        assert RollingDisc("model")._add_prefix(names) == expected
+
     def test_invalid_model(self) -> None:
         disc = RollingDisc("model")
         with pytest.raises(TypeError):
@@ -97,6 +109,24 @@ class TestModelBase:
         with pytest.raises(TypeError):
             disc.tire = KnifeEdgeWheel("disc")
 
+    def test_submodels_after_overwrite(self) -> None:
+        disc = RollingDisc("model")
+        assert disc.submodels == ()
+        disc.wheel = KnifeEdgeWheel("disc")
+        assert disc.submodels == (disc.wheel,)
+        disc.ground = FlatGround("ground")
+        assert set(disc.submodels) == {disc.wheel, disc.ground}
+        disc.wheel = None
+        assert disc.submodels == (disc.ground,)
+
+    def test_connections_after_overwrite(self) -> None:
+        disc = RollingDisc("model")
+        assert disc.connections == ()
+        disc.tire = NonHolonomicTire("tire")
+        assert disc.connections == (disc.tire,)
+        disc.tire = None
+        assert disc.connections == ()
+
     @pytest.mark.usefixtures("_create_model")
     def test_overwrite_submodel_of_connection(self) -> None:
         self.disc.define_connections()
@@ -135,6 +165,63 @@ class TestModelBase:
         self.disc.define_all()
         assert self.disc.get_description(Symbol("not_existing_symbol")) is None
 
+    @pytest.mark.usefixtures("_create_model")
+    def test_get_all_descriptions(self) -> None:
+        self.disc.define_all()
+        descriptions = self.disc._get_all_descriptions()
+        for obj in (self.disc.q[0], self.disc.wheel.radius,
+                    self.disc.tire.symbols["my_sym1"], self.load_group.symbols["T"]):
+            assert descriptions[obj] == self.disc.get_description(obj)
+
+    @pytest.mark.usefixtures("_create_model")
+    def test_get_description_after_redefinition(self) -> None:
+        self.disc.define_all()
+        assert self.disc.get_description(self.disc.wheel.radius) is not None
+        load_group = MyLoad("load2")
+        self.disc.wheel.add_load_groups(load_group)
+        load_group.define_objects()
+        assert self.disc.get_description(load_group.symbols["T"]) is not None
+
+    @pytest.mark.usefixtures("_create_model")
+    def test_get_description_cached_miss(self, mocker) -> None:
+        self.disc.define_all()
+        spy = mocker.spy(self.disc, "_get_all_descriptions")
+        for _ in range(2):
+            assert self.disc.get_description(dynamicsymbols._t) is None
+        assert spy.call_count == 1
+        FlatGround("other_ground").define_objects()  # Unrelated object.
+        assert self.disc.get_description(dynamicsymbols._t) is None
+        assert spy.call_count == 1
+
+    @pytest.mark.usefixtures("_create_model")
+    def test_get_description_after_swapping_grandchild(self) -> None:
+        class MyModel(ModelBase):
+            required_models: tuple[ModelRequirement, ...] = (
+                ModelRequirement("rolling_disc", RollingDisc, "Rolling disc model."),
+            )
+
+            def _define_objects(self) -> None:
+                super()._define_objects()
+                self._system = System(self.rolling_disc.system.frame,
+                                      self.rolling_disc.system.fixed_point)
+
+        class MyWheel(KnifeEdgeWheel):
+            @property
+            def descriptions(self) -> dict[object, str]:
+                """Dictionary of descriptions of the wheel's attributes."""
+                return {**super().descriptions, self.radius: "New radius."}
+
+        root = MyModel("root")
+        root.rolling_disc = self.disc
+        root.define_connections()
+        root.define_objects()
+        radius = self.disc.wheel.radius
+        assert root.get_description(radius) != "New radius."
+        self.disc.wheel = MyWheel(self.disc.wheel.name)
+        self.disc.wheel.define_objects()
+        assert self.disc.wheel.radius == radius
+        assert root.get_description(radius) == "New radius."
+
     @pytest.mark.usefixtures("_create_model")
     def test_traversal_get_all_symbols(self) -> None:
         self.disc.define_all()
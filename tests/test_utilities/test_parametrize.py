@@ -1,9 +1,11 @@
+from __future__ import annotations
+
 from pathlib import Path
 
 import numpy as np
 import pytest
-from sympy import diag
-from sympy.physics.mechanics import RigidBody, msubs
+from sympy import diag, lambdify
+from sympy.physics.mechanics import RigidBody, find_dynamicsymbols
 
 from symbrim.bicycle.cranks import MasslessCranks
 from symbrim.bicycle.front_frames import RigidFrontFrameMoore
@@ -35,23 +37,77 @@ except ImportError:
     pytest.skip("bicycleparameters not installed", allow_module_level=True)
 
 data_dir = Path(__file__[:__file__.index("tests")]) / "data"
+bicycles_dir, riders_dir = data_dir / "bicycles", data_dir / "riders"
 
 
 def _check_dir(bicycle: str, rider: str) -> bool:
-    if bicycle is not None and not (Path(data_dir) / "bicycles" / bicycle).is_dir():
+    if bicycle is not None and not (bicycles_dir / bicycle).is_dir():
         return False
-    if rider is not None and not (Path(data_dir) / "riders" / rider).is_dir():
+    if rider is not None and not (riders_dir / rider).is_dir():
         return False
     if bicycle is not None and rider is not None:
-        raw_data_dir = Path(data_dir) / "riders" / rider / "RawData"
+        raw_data_dir = riders_dir / rider / "RawData"
         if not (
-            (Path(raw_data_dir) / f"{rider}{bicycle}YeadonCFG.txt").is_file()
-            and (Path(raw_data_dir) / f"{rider}YeadonMeas.txt").is_file()
+            (raw_data_dir / f"{rider}{bicycle}YeadonCFG.txt").is_file()
+            and (raw_data_dir / f"{rider}YeadonMeas.txt").is_file()
         ):
             return False
     return True
 
 
+@pytest.fixture(scope="module")
+def benchmark_bicycle() -> Bicycle:
+    return Bicycle("Benchmark", pathToData=data_dir)
+
+
+@pytest.fixture(scope="module")
+def bicycle_with_rider(request) -> Bicycle:
+    bicycle, rider = request.param
+    bike = Bicycle(bicycle, pathToData=data_dir)
+    bike.add_rider(rider, reCalc=True)
+    return bike
+
+
+@pytest.fixture(scope="module")
+def rigid_body() -> RigidBody:
+    return RigidBody("body")
+
+
+@pytest.fixture(scope="module")
+def defined_bicycle_rider() -> BicycleRider:
+    bike = WhippleBicycleMoore("bicycle")
+    bike.front_frame = RigidFrontFrameMoore("front_frame")
+    bike.rear_frame = RigidRearFrameMoore("rear_frame")
+    bike.front_wheel = KnifeEdgeWheel("front_wheel")
+    bike.rear_wheel = KnifeEdgeWheel("rear_wheel")
+    bike.front_tire = NonHolonomicTire("front_tire")
+    bike.rear_tire = NonHolonomicTire("rear_tire")
+    bike.cranks = MasslessCranks("cranks")
+    bike.ground = FlatGround("ground")
+
+    rider = Rider("rider")
+    rider.pelvis = PlanarPelvis("pelvis")
+    rider.torso = PlanarTorso("torso")
+    rider.left_arm = PinElbowStickLeftArm("left_arm")
+    rider.right_arm = PinElbowStickRightArm("right_arm")
+    rider.left_leg = TwoPinStickLeftLeg("left_leg")
+    rider.right_leg = TwoPinStickRightLeg("right_leg")
+    rider.sacrum = FixedSacrum("sacrum")
+    rider.left_hip = SphericalLeftHip("left_hip")
+    rider.right_hip = SphericalRightHip("right_hip")
+    rider.left_shoulder = SphericalLeftShoulder("left_shoulder")
+    rider.right_shoulder = SphericalRightShoulder("right_shoulder")
+    br = BicycleRider("br")
+    br.bicycle = bike
+    br.rider = rider
+    br.seat = SideLeanSeat("seat")
+    br.pedals = HolonomicPedals("pedals")
+    br.hand_grips = HolonomicHandGrips("steer_conn")
+
+    br.define_all()
+    return br
+
+
 @pytest.mark.skipif(
     not data_dir.is_dir() and not ON_CI, reason="data directory not found"
 )
@@ -78,40 +134,6 @@ class TestParametrize:
         self.bike.ground = FlatGround("ground")
         self.bike.define_all()
 
-    @pytest.fixture
-    def _setup_full_model(self) -> None:
-        self.bike = WhippleBicycleMoore("bicycle")
-        self.bike.front_frame = RigidFrontFrameMoore("front_frame")
-        self.bike.rear_frame = RigidRearFrameMoore("rear_frame")
-        self.bike.front_wheel = KnifeEdgeWheel("front_wheel")
-        self.bike.rear_wheel = KnifeEdgeWheel("rear_wheel")
-        self.bike.front_tire = NonHolonomicTire("front_tire")
-        self.bike.rear_tire = NonHolonomicTire("rear_tire")
-        self.bike.cranks = MasslessCranks("cranks")
-        self.bike.ground = FlatGround("ground")
-
-        self.rider = Rider("rider")
-        self.rider.pelvis = PlanarPelvis("pelvis")
-        self.rider.torso = PlanarTorso("torso")
-        self.rider.left_arm = PinElbowStickLeftArm("left_arm")
-        self.rider.right_arm = PinElbowStickRightArm("right_arm")
-        self.rider.left_leg = TwoPinStickLeftLeg("left_leg")
-        self.rider.right_leg = TwoPinStickRightLeg("right_leg")
-        self.rider.sacrum = FixedSacrum("sacrum")
-        self.rider.left_hip = SphericalLeftHip("left_hip")
-        self.rider.right_hip = SphericalRightHip("right_hip")
-        self.rider.left_shoulder = SphericalLeftShoulder("left_shoulder")
-        self.rider.right_shoulder = SphericalRightShoulder("right_shoulder")
-        self.br = BicycleRider("br")
-        self.br.bicycle = self.bike
-        self.br.rider = self.rider
-        self.br.seat = SideLeanSeat("seat")
-        self.br.pedals = HolonomicPedals("pedals")
-        self.br.hand_grips = HolonomicHandGrips("steer_conn")
-
-        self.br.define_all()
-        self.system = self.br.to_system()
-
     @pytest.mark.parametrize(("args", "kwargs", "expected"), [
         ([], {}, {}),
         ([1], {}, {"ixx": 1}),
@@ -123,17 +145,19 @@ class TestParametrize:
         ([np.matrix([[1, 2, 3], [2, 4, 5], [3, 5, 6]])], {},
          {"ixx": 1, "iyy": 4, "izz": 6, "ixy": 2, "iyz": 5, "izx": 3}),
     ])
-    def test_get_inertia_vals(self, args, kwargs, expected) -> None:
-        body = RigidBody("body")
-        params = get_inertia_vals(body, *args, **kwargs)
-        params = {k.name[-3:]: v for k, v in params.items()}
-        assert params == expected
+    def test_get_inertia_vals(self, rigid_body, args, kwargs, expected) -> None:
+        params = get_inertia_vals(rigid_body, *args, **kwargs)
+        i_mat = rigid_body.central_inertia.to_matrix(rigid_body.frame)
+        inertia_syms = {"ixx": i_mat[0, 0], "iyy": i_mat[1, 1], "izz": i_mat[2, 2],
+                        "ixy": i_mat[0, 1], "iyz": i_mat[1, 2], "izx": i_mat[0, 2]}
+        assert params == {inertia_syms[name]: val for name, val in expected.items()}
 
     @pytest.mark.usefixtures("_setup_moore_bicycle")
-    def test_benchmark_moore(self) -> None:
-        def get_inertia_matrix(model):
-            return model.body.central_inertia.to_matrix(model.body.frame)
-
+    def test_benchmark_moore(self, benchmark_bicycle) -> None:
+        i_rw, i_fw, i_rf, i_ff = (
+            model.body.central_inertia.to_matrix(model.body.frame) for model in (
+                self.bike.rear_wheel, self.bike.front_wheel, self.bike.rear_frame,
+                self.bike.front_frame))
         constants = {
             self.bike.front_wheel.symbols["r"]: 0.35,
             self.bike.rear_wheel.symbols["r"]: 0.3,
@@ -148,73 +172,81 @@ class TestParametrize:
             self.bike.rear_wheel.body.mass: 2.0,
             self.bike.front_frame.body.mass: 4.0,
             self.bike.front_wheel.body.mass: 3.0,
-            get_inertia_matrix(self.bike.rear_wheel)[0, 0]: 0.0603,
-            get_inertia_matrix(self.bike.rear_wheel)[1, 1]: 0.12,
-            get_inertia_matrix(self.bike.front_wheel)[0, 0]: 0.1405,
-            get_inertia_matrix(self.bike.front_wheel)[1, 1]: 0.28,
-            get_inertia_matrix(self.bike.rear_frame)[0, 0]: 7.178169776497895,
-            get_inertia_matrix(self.bike.rear_frame)[1, 1]: 11.0,
-            get_inertia_matrix(self.bike.rear_frame)[0, 2]: 3.8225535938357873,
-            get_inertia_matrix(self.bike.rear_frame)[2, 2]: 4.821830223502103,
-            get_inertia_matrix(self.bike.front_frame)[0, 0]: 0.05841337700152972,
-            get_inertia_matrix(self.bike.front_frame)[1, 1]: 0.06,
-            get_inertia_matrix(self.bike.front_frame)[0, 2]: 0.009119225261946298,
-            get_inertia_matrix(self.bike.front_frame)[2, 2]: 0.007586622998470264}
-        params = self.bike.get_param_values(Bicycle("Benchmark", pathToData=data_dir))
+            i_rw[0, 0]: 0.0603,
+            i_rw[1, 1]: 0.12,
+            i_fw[0, 0]: 0.1405,
+            i_fw[1, 1]: 0.28,
+            i_rf[0, 0]: 7.178169776497895,
+            i_rf[1, 1]: 11.0,
+            i_rf[0, 2]: 3.8225535938357873,
+            i_rf[2, 2]: 4.821830223502103,
+            i_ff[0, 0]: 0.05841337700152972,
+            i_ff[1, 1]: 0.06,
+            i_ff[0, 2]: 0.009119225261946298,
+            i_ff[2, 2]: 0.007586622998470264}
+        params = self.bike.get_param_values(benchmark_bicycle)
         for sym, value in constants.items():
             assert params[sym] == pytest.approx(value, abs=1e-10)
 
-    @pytest.mark.parametrize(("bicycle", "rider"), [
-        ("Browser", "Jason"),
-        ("Rigidcl", "Luke"),
-    ])
-    @pytest.mark.usefixtures("_setup_full_model")
-    def test_full_model_example(self, bicycle, rider) -> None:
-        if not _check_dir(bicycle, rider):
-            pytest.skip("data not found")
-        bike_params = Bicycle(bicycle, pathToData=data_dir)
-        bike_params.add_rider(rider, reCalc=True)
+    @pytest.mark.parametrize("bicycle_with_rider", [
+        pytest.param(data, id="-".join(data),
+                     marks=pytest.mark.skipif(not _check_dir(*data),
+                                              reason="data not found"))
+        for data in (("Browser", "Jason"), ("Rigidcl", "Luke"))
+    ], indirect=True)
+    def test_full_model_example(self, defined_bicycle_rider, bicycle_with_rider
+                                ) -> None:
+        br = defined_bicycle_rider
+        bike, rider, system = br.bicycle, br.rider, br.to_system()
+        bike_params = bicycle_with_rider
         bp = remove_uncertainties(bike_params.parameters["Benchmark"])
         mp = remove_uncertainties(bike_params.parameters["Measured"])
-        constants = self.br.get_param_values(bike_params)
+        constants = br.get_param_values(bike_params)
         constants.update({
-            self.br.seat.symbols["alpha"]: -0.7,
-            self.bike.cranks.symbols["radius"]: 0.15,
-            self.bike.cranks.symbols["offset"]: constants[self.rider.pelvis.symbols[
+            br.seat.symbols["alpha"]: -0.7,
+            bike.cranks.symbols["radius"]: 0.15,
+            bike.cranks.symbols["offset"]: constants[rider.pelvis.symbols[
                 "hip_width"]] / 2,
-            self.bike.symbols["gear_ratio"]: 2.0
+            bike.symbols["gear_ratio"]: 2.0
         })
-        initial_conditions = {qi: 0 for qi in self.system.q}
-        initial_conditions.update({ui: 0 for ui in self.system.u})
-        initial_conditions[self.bike.q[4]] = bp["lam"]
+        initial_conditions = {qi: 0 for qi in system.q}
+        initial_conditions.update({ui: 0 for ui in system.u})
+        initial_conditions[bike.q[4]] = bp["lam"]
         params = {**constants, **initial_conditions}
-        assert msubs(self.bike.rear_tire.contact_point.pos_from(
-            self.bike.rear_wheel.center).magnitude(), params
-                     ) == pytest.approx(bp["rR"], abs=1e-10)
-        assert msubs(self.bike.front_tire.contact_point.pos_from(
-            self.bike.front_wheel.center).magnitude(), params
-                     ) == pytest.approx(bp["rF"], abs=1e-10)
-        assert msubs(self.bike.rear_tire.contact_point.pos_from(
-            self.bike.front_tire.contact_point).magnitude(), params
-                     ) == pytest.approx(bp["w"], abs=1e-10)
-        assert msubs(self.bike.cranks.center_point.pos_from(
-            self.bike.rear_wheel.center).magnitude(), params
-                     ) == pytest.approx(mp["lcs"], abs=1e-10)
-        assert msubs(self.bike.cranks.center_point.pos_from(
-            self.bike.front_tire.contact_point).dot(
-            self.bike.ground.get_normal(self.bike.front_tire.contact_point)), params
-                     ) == pytest.approx(mp["hbb"], abs=1e-10)
-        assert msubs(self.bike.cranks.center_point.pos_from(
-            self.bike.rear_frame.saddle.point).magnitude(), params
-                     ) == pytest.approx(mp["lst"] + mp["lsp"], abs=1e-10)
-        assert msubs(self.bike.front_frame.left_hand_grip.point.pos_from(
-            self.bike.front_frame.right_hand_grip.point).magnitude(), params
-                     ) == pytest.approx(mp["whb"], abs=1e-10)
-        for hand_grip in (self.bike.front_frame.left_hand_grip,
-                          self.bike.front_frame.right_hand_grip):
-            assert msubs(hand_grip.point.pos_from(
-                self.bike.rear_wheel.center).magnitude(), params
-                         ) == pytest.approx(mp["LhbR"], abs=1e-10)
-            assert msubs(hand_grip.point.pos_from(
-                self.bike.front_wheel.center).magnitude(), params
-                         ) == pytest.approx(mp["LhbF"], abs=1e-10)
+        checks = [
+            (bike.rear_tire.contact_point.pos_from(
+                bike.rear_wheel.center).magnitude(), bp["rR"]),
+            (bike.front_tire.contact_point.pos_from(
+                bike.front_wheel.center).magnitude(), bp["rF"]),
+            (bike.rear_tire.contact_point.pos_from(
+                bike.front_tire.contact_point).magnitude(), bp["w"]),
+            (bike.cranks.center_point.pos_from(
+                bike.rear_wheel.center).magnitude(), mp["lcs"]),
+            (bike.cranks.center_point.pos_from(
+                bike.front_tire.contact_point).dot(
+                bike.ground.get_normal(bike.front_tire.contact_point)),
+             mp["hbb"]),
+            (bike.cranks.center_point.pos_from(
+                bike.rear_frame.saddle.point).magnitude(), mp["lst"] + mp["lsp"]),
+            (bike.front_frame.left_hand_grip.point.pos_from(
+                bike.front_frame.right_hand_grip.point).magnitude(), mp["whb"]),
+        ]
+        for hand_grip in (bike.front_frame.left_hand_grip,
+                          bike.front_frame.right_hand_grip):
+            checks.extend([
+                (hand_grip.point.pos_from(bike.rear_wheel.center).magnitude(),
+                 mp["LhbR"]),
+                (hand_grip.point.pos_from(bike.front_wheel.center).magnitude(),
+                 mp["LhbF"]),
+            ])
+        # Evaluate all expressions with a single numerical function instead of
+        # substituting the parameters in each expression separately. The expressions
+        # share the kinematics of the bicycle, which are therefore eliminated as common
+        # subexpressions.
+        exprs, expected = zip(*checks)
+        free = set().union(*(expr.free_symbols | find_dynamicsymbols(expr)
+                             for expr in exprs))
+        args = [sym for sym in params if sym in free]
+        eval_checks = lambdify(args, exprs, cse=True)
+        np.testing.assert_allclose(eval_checks(*(params[sym] for sym in args)),
+                                   expected, rtol=0, atol=1e-10)
@@ -65,3 +65,8 @@ class TestCheckZero:
     def test_non_expression(self) -> None:
         assert check_zero(0.0)
         assert not check_zero(3.3)
+
+    def test_structurally_zero(self, mocker) -> None:
+        lambdify = mocker.patch("symbrim.utilities.utilities.lambdify")
+        assert check_zero(a - a)
+        lambdify.assert_not_called()